@@ -14,9 +14,10 @@ Usage
 from __future__ import annotations
 
 import argparse
+import logging
 import sys
 import time
-from typing import NoReturn
+from typing import Any, Dict, NoReturn
 
 import schedule as schedule_lib  # 'schedule' library
 
@@ -39,47 +40,68 @@ def run_pipeline(config_path: str | None = None) -> None:
     log_dir = config.get("paths", {}).get("log_dir", "logs")
     logger = setup_logging(log_dir=log_dir)
 
-    logger.info("=" * 60)
-    logger.info("Weather ETL pipeline – run started")
-    logger.info("=" * 60)
+    _run_pipeline_inner(config, logger)
 
-    cities = config.get("cities", [])
-    api_config = config.get("api", {})
-    data_dir = config.get("paths", {}).get("data_dir", "data")
-    db_path = config.get("paths", {}).get("database", "data/weather.db")
 
-    if not cities:
-        logger.error("No cities defined in configuration – aborting.")
-        return
+def _run_pipeline_inner(config: Dict[str, Any], logger: logging.Logger) -> None:
+    """Run the Extract → Transform → Load stages for an already loaded *config*.
 
-    # ── Extract ──────────────────────────────────────────────
-    logger.info("PHASE 1 / 3 — Extract")
-    raw_records = extract_all(cities, api_config)
+    Parameters
+    ----------
+    config : dict
+        Parsed configuration, as returned by :func:`load_config`.
+    logger : logging.Logger
+        Application logger, as returned by :func:`setup_logging`.
+    """
+    try:
+        logger.info("=" * 60)
+        logger.info("Weather ETL pipeline – run started")
+        logger.info("=" * 60)
+
+        cities = config.get("cities", [])
+        api_config = config.get("api", {})
+        data_dir = config.get("paths", {}).get("data_dir", "data")
+        db_path = config.get("paths", {}).get("database", "data/weather.db")
 
-    if not raw_records:
-        logger.warning("No data extracted – pipeline ending early.")
-        return
+        if not cities:
+            logger.error("No cities defined in configuration – aborting.")
+            return
 
-    # ── Transform ────────────────────────────────────────────
-    logger.info("PHASE 2 / 3 — Transform")
-    df = transform(raw_records)
+        # ── Extract ──────────────────────────────────────────
+        logger.info("PHASE 1 / 3 — Extract")
+        raw_records = extract_all(cities, api_config)
 
-    if df.empty:
-        logger.warning("Transformation resulted in empty data – skipping load.")
-        return
+        if not raw_records:
+            logger.warning("No data extracted – pipeline ending early.")
+            return
 
-    # ── Load ─────────────────────────────────────────────────
-    logger.info("PHASE 3 / 3 — Load")
-    csv_path = load_to_csv(df, data_dir=data_dir)
-    rows_inserted = load_to_sqlite(df, db_path=db_path)
+        # ── Transform ────────────────────────────────────────
+        logger.info("PHASE 2 / 3 — Transform")
+        rows = transform(raw_records)
 
-    logger.info("Pipeline run complete.  CSV → %s | SQLite rows inserted → %d", csv_path, rows_inserted)
-    logger.info("=" * 60)
+        if not rows:
+            logger.warning("Transformation resulted in empty data – skipping load.")
+            return
+
+        # ── Load ─────────────────────────────────────────────
+        logger.info("PHASE 3 / 3 — Load")
+        csv_path = load_to_csv(rows, data_dir=data_dir)
+        rows_inserted = load_to_sqlite(rows, db_path=db_path)
+
+        logger.info("Pipeline run complete.  CSV → %s | SQLite rows inserted → %d", csv_path, rows_inserted)
+        logger.info("=" * 60)
+    finally:
+        # Write out the buffered file log at the end of every run
+        for handler in logger.handlers:
+            handler.flush()
 
 
 def run_scheduled(config_path: str | None = None) -> NoReturn:
     """Run the pipeline on a recurring schedule defined in the config.
 
+    The configuration is read once at start-up; restart the scheduler to pick
+    up changes to the YAML file.
+
     Parameters
     ----------
     config_path : str | None
@@ -92,13 +114,14 @@ def run_scheduled(config_path: str | None = None) -> NoReturn:
     logger.info("Scheduler started – running every %d minute(s).", interval)
 
     # Run immediately on start, then schedule subsequent runs
-    run_pipeline(config_path)
+    _run_pipeline_inner(config, logger)
 
-    schedule_lib.every(interval).minutes.do(run_pipeline, config_path)
+    schedule_lib.every(interval).minutes.do(_run_pipeline_inner, config, logger)
 
+    # Sleep until the next run is due rather than polling every second
     while True:
+        time.sleep(max(schedule_lib.idle_seconds(), 0))
         schedule_lib.run_pending()
-        time.sleep(1)
 
 
 # ── CLI ──────────────────────────────────────────────────────
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import time
 from unittest.mock import MagicMock, patch
 
+import orjson
 import pytest
 import requests
+from urllib3.response import HTTPResponse
 
-from weather_etl.extract import extract_all, fetch_weather
+from weather_etl.extract import _get_session, extract_all, fetch_weather
 
 # ── Fixtures ─────────────────────────────────────────────────
 
@@ -37,13 +40,14 @@ SAMPLE_RESPONSE = {
 # ── fetch_weather ────────────────────────────────────────────
 
 
-@patch("weather_etl.extract.requests.get")
-def test_fetch_weather_success(mock_get: MagicMock) -> None:
+@patch("weather_etl.extract._get_session")
+def test_fetch_weather_success(mock_session: MagicMock) -> None:
     """Successful API call returns parsed JSON."""
     mock_resp = MagicMock()
     mock_resp.status_code = 200
-    mock_resp.json.return_value = SAMPLE_RESPONSE
+    mock_resp.content = orjson.dumps(SAMPLE_RESPONSE)
     mock_resp.raise_for_status = MagicMock()
+    mock_get = mock_session.return_value.get
     mock_get.return_value = mock_resp
 
     result = fetch_weather(PARIS, base_url=API_CONFIG["base_url"])
@@ -53,10 +57,22 @@ def test_fetch_weather_success(mock_get: MagicMock) -> None:
     mock_get.assert_called_once()
 
 
-@patch("weather_etl.extract.requests.get")
-def test_fetch_weather_timeout_retries(mock_get: MagicMock) -> None:
-    """Timeouts trigger retries up to max_retries."""
-    mock_get.side_effect = requests.exceptions.Timeout("timeout")
+@patch("weather_etl.extract._get_session")
+def test_fetch_weather_invalid_json(mock_session: MagicMock) -> None:
+    """A body that is not valid JSON returns None."""
+    mock_resp = MagicMock()
+    mock_resp.content = b"<html>maintenance</html>"
+    mock_session.return_value.get.return_value = mock_resp
+
+    result = fetch_weather(PARIS, base_url=API_CONFIG["base_url"])
+
+    assert result is None
+
+
+@patch("weather_etl.extract._get_session")
+def test_fetch_weather_timeout(mock_session: MagicMock) -> None:
+    """A timeout that survives the adapter's retries returns None."""
+    mock_session.return_value.get.side_effect = requests.exceptions.Timeout("timeout")
 
     result = fetch_weather(
         PARIS,
@@ -66,41 +82,78 @@ def test_fetch_weather_timeout_retries(mock_get: MagicMock) -> None:
     )
 
     assert result is None
-    assert mock_get.call_count == 2
+    mock_session.assert_called_once_with(2, 1)
 
 
-@patch("weather_etl.extract.requests.get")
-def test_fetch_weather_http_error(mock_get: MagicMock) -> None:
-    """Non-200 responses trigger retries."""
+@patch("weather_etl.extract._get_session")
+def test_fetch_weather_http_error(mock_session: MagicMock) -> None:
+    """Non-200 responses return None."""
     mock_resp = MagicMock()
     mock_resp.raise_for_status.side_effect = requests.exceptions.HTTPError("500")
-    mock_get.return_value = mock_resp
+    mock_session.return_value.get.return_value = mock_resp
 
-    result = fetch_weather(
-        PARIS,
-        base_url=API_CONFIG["base_url"],
-        max_retries=2,
-        backoff_factor=1,
-    )
+    result = fetch_weather(PARIS, base_url=API_CONFIG["base_url"])
 
     assert result is None
-    assert mock_get.call_count == 2
-
+    mock_session.return_value.get.assert_called_once()
 
-@patch("weather_etl.extract.requests.get")
-def test_fetch_weather_unrecoverable(mock_get: MagicMock) -> None:
-    """Unrecoverable errors do not retry."""
-    mock_get.side_effect = requests.exceptions.RequestException("fatal")
 
-    result = fetch_weather(
-        PARIS,
-        base_url=API_CONFIG["base_url"],
-        max_retries=3,
-        backoff_factor=1,
+@patch("weather_etl.extract._get_session")
+def test_fetch_weather_unrecoverable(mock_session: MagicMock) -> None:
+    """Request errors are not re-raised."""
+    mock_session.return_value.get.side_effect = requests.exceptions.RequestException(
+        "fatal"
     )
 
+    result = fetch_weather(PARIS, base_url=API_CONFIG["base_url"])
+
     assert result is None
-    assert mock_get.call_count == 1
+
+
+# ── _get_session ─────────────────────────────────────────────
+
+
+def test_get_session_retry_policy() -> None:
+    """Sessions carry the requested retry policy and are reused per policy."""
+    session = _get_session(2, 1)
+    retry = session.get_adapter(API_CONFIG["base_url"]).max_retries
+
+    assert retry.total == 2
+    assert retry.backoff_factor == 1
+    assert retry.backoff_max == 30
+    assert 503 in retry.status_forcelist
+    assert _get_session(2, 1) is session
+    assert _get_session(3, 1) is not session
+
+
+def test_get_session_first_retry_is_jittered() -> None:
+    """The very first retry already waits a jittered, non-zero delay."""
+    retry = _get_session(3, 2).get_adapter(API_CONFIG["base_url"]).max_retries
+    retry = retry.increment(method="GET", url="/", response=HTTPResponse(status=503))
+
+    assert 1.0 <= retry.get_backoff_time() < 3.0
+
+
+def test_get_session_backoff_is_capped() -> None:
+    """Back-off never exceeds 30 seconds, however many failures occurred."""
+    retry = _get_session(10, 10).get_adapter(API_CONFIG["base_url"]).max_retries
+    for _ in range(4):
+        retry = retry.increment(method="GET", url="/", response=HTTPResponse(status=503))
+
+    assert retry.get_backoff_time() == 30
+
+
+@patch("urllib3.util.retry.time.sleep")
+def test_get_session_ignores_retry_after(mock_sleep: MagicMock) -> None:
+    """A server's Retry-After header cannot stretch the wait past the cap."""
+    retry = _get_session(2, 1).get_adapter(API_CONFIG["base_url"]).max_retries
+    response = HTTPResponse(status=503, headers={"Retry-After": "3600"})
+    retry = retry.increment(method="GET", url="/", response=response)
+
+    retry.sleep(response)
+
+    mock_sleep.assert_called_once()
+    assert 0.5 <= mock_sleep.call_args.args[0] < 1.5
 
 
 # ── extract_all ──────────────────────────────────────────────
@@ -109,10 +162,51 @@ def test_fetch_weather_unrecoverable(mock_get: MagicMock) -> None:
 @patch("weather_etl.extract.fetch_weather")
 def test_extract_all_partial_failure(mock_fetch: MagicMock) -> None:
     """Pipeline continues when some cities fail."""
-    mock_fetch.side_effect = [SAMPLE_RESPONSE, None]
+    mock_fetch.side_effect = lambda city, **_: (
+        SAMPLE_RESPONSE if city["name"] == "Paris" else None
+    )
 
     cities = [PARIS, {"name": "Bad", "latitude": 0, "longitude": 0}]
     results = extract_all(cities, API_CONFIG)
 
     assert len(results) == 1
     assert results[0]["city"] == "Paris"
+
+
+@patch("weather_etl.extract.fetch_weather")
+def test_extract_all_preserves_city_order(mock_fetch: MagicMock) -> None:
+    """Results follow the input order regardless of completion order."""
+    delays = {"Paris": 0.05, "Lyon": 0.0, "Nice": 0.02}
+
+    def fake_fetch(city, **_):
+        time.sleep(delays[city["name"]])
+        return SAMPLE_RESPONSE
+
+    mock_fetch.side_effect = fake_fetch
+    cities = [{"name": name, "latitude": 0, "longitude": 0} for name in delays]
+    results = extract_all(cities, API_CONFIG)
+
+    assert [r["city"] for r in results] == ["Paris", "Lyon", "Nice"]
+
+
+@patch("weather_etl.extract.fetch_weather")
+@patch("weather_etl.extract._get_session")
+def test_extract_all_shares_one_session(
+    mock_session: MagicMock, mock_fetch: MagicMock
+) -> None:
+    """The session is resolved once and handed to every worker."""
+    mock_fetch.return_value = SAMPLE_RESPONSE
+    cities = [{"name": name, "latitude": 0, "longitude": 0} for name in "ABCD"]
+
+    extract_all(cities, API_CONFIG)
+
+    mock_session.assert_called_once_with(2, 1)
+    sessions = {call.kwargs["session"] for call in mock_fetch.call_args_list}
+    assert sessions == {mock_session.return_value}
+
+
+@patch("weather_etl.extract.fetch_weather")
+def test_extract_all_empty(mock_fetch: MagicMock) -> None:
+    """No cities means no requests and an empty result."""
+    assert extract_all([], API_CONFIG) == []
+    mock_fetch.assert_not_called()
@@ -4,41 +4,50 @@ from __future__ import annotations
 
 import sqlite3
 from pathlib import Path
+from typing import Any, Dict, List
 
 import pandas as pd
 import pytest
 
 from weather_etl.load import load_to_csv, load_to_sqlite
+from weather_etl.transform import EXPECTED_COLUMNS
 
 # ── Fixtures ─────────────────────────────────────────────────
 
 
 @pytest.fixture()
-def sample_df() -> pd.DataFrame:
-    """Return a small DataFrame that mirrors the pipeline output."""
-    return pd.DataFrame(
+def sample_rows() -> List[Dict[str, Any]]:
+    """Return a small list of rows that mirrors the pipeline output."""
+    return [
         {
-            "city": ["Paris", "Lyon"],
-            "timestamp": ["2026-02-18T22:00", "2026-02-18T22:00"],
-            "temperature_c": [7.2, 5.8],
-            "windspeed_kmh": [12.5, 8.3],
-            "winddirection_deg": [210.0, 180.0],
-            "weathercode": [3, 1],
-            "is_day": [0, 0],
-            "retrieval_timestamp": [
-                "2026-02-18T22:01:00+00:00",
-                "2026-02-18T22:01:00+00:00",
-            ],
-        }
-    )
+            "city": "Paris",
+            "timestamp": "2026-02-18T22:00",
+            "temperature_c": 7.2,
+            "windspeed_kmh": 12.5,
+            "winddirection_deg": 210.0,
+            "weathercode": 3,
+            "is_day": 0,
+            "retrieval_timestamp": "2026-02-18T22:01:00+00:00",
+        },
+        {
+            "city": "Lyon",
+            "timestamp": "2026-02-18T22:00",
+            "temperature_c": 5.8,
+            "windspeed_kmh": 8.3,
+            "winddirection_deg": 180.0,
+            "weathercode": 1,
+            "is_day": 0,
+            "retrieval_timestamp": "2026-02-18T22:01:00+00:00",
+        },
+    ]
 
 
 # ── CSV tests ────────────────────────────────────────────────
 
 
-def test_load_to_csv_creates_file(tmp_path: Path, sample_df: pd.DataFrame) -> None:
+def test_load_to_csv_creates_file(tmp_path: Path, sample_rows: List[Dict[str, Any]]) -> None:
     """CSV file is created in the specified directory."""
-    result = load_to_csv(sample_df, data_dir=tmp_path)
+    result = load_to_csv(sample_rows, data_dir=tmp_path)
 
     assert result is not None
     assert result.exists()
@@ -46,12 +55,35 @@ def test_load_to_csv_creates_file(tmp_path: Path, sample_df: pd.DataFrame) -> No
 
     loaded = pd.read_csv(result)
     assert len(loaded) == 2
+    assert list(loaded.columns) == EXPECTED_COLUMNS
+
+
+def test_load_to_csv_appends(tmp_path: Path, sample_rows: List[Dict[str, Any]]) -> None:
+    """Subsequent loads append to the same file with a single header."""
+    first = load_to_csv(sample_rows, data_dir=tmp_path)
+    second = load_to_csv(sample_rows, data_dir=tmp_path)
+
+    assert first == second
+    assert len(list(tmp_path.glob("*.csv"))) == 1
+
+    loaded = pd.read_csv(second)
+    assert len(loaded) == 4
+    assert list(loaded.columns) == EXPECTED_COLUMNS
+
 
+def test_load_to_csv_missing_values(tmp_path: Path, sample_rows: List[Dict[str, Any]]) -> None:
+    """``None`` values are written as empty cells."""
+    sample_rows[0]["temperature_c"] = None
+    result = load_to_csv(sample_rows, data_dir=tmp_path)
 
-def test_load_to_csv_empty_df(tmp_path: Path) -> None:
-    """Empty DataFrame produces no CSV file."""
-    empty = pd.DataFrame()
-    result = load_to_csv(empty, data_dir=tmp_path)
+    loaded = pd.read_csv(result)
+    assert pd.isna(loaded.loc[0, "temperature_c"])
+    assert loaded.loc[1, "temperature_c"] == 5.8
+
+
+def test_load_to_csv_empty_rows(tmp_path: Path) -> None:
+    """No rows produces no CSV file."""
+    result = load_to_csv([], data_dir=tmp_path)
 
     assert result is None
 
@@ -59,10 +91,10 @@ def test_load_to_csv_empty_df(tmp_path: Path) -> None:
 # ── SQLite tests ─────────────────────────────────────────────
 
 
-def test_load_to_sqlite_creates_table(tmp_path: Path, sample_df: pd.DataFrame) -> None:
+def test_load_to_sqlite_creates_table(tmp_path: Path, sample_rows: List[Dict[str, Any]]) -> None:
     """Data is inserted and the table is created automatically."""
     db = tmp_path / "test.db"
-    inserted = load_to_sqlite(sample_df, db_path=db)
+    inserted = load_to_sqlite(sample_rows, db_path=db)
 
     assert inserted == 2
 
@@ -71,20 +103,56 @@ def test_load_to_sqlite_creates_table(tmp_path: Path, sample_df: pd.DataFrame) -
     assert rows == 2
 
 
-def test_load_to_sqlite_appends(tmp_path: Path, sample_df: pd.DataFrame) -> None:
+def test_load_to_sqlite_uses_wal(tmp_path: Path, sample_rows: List[Dict[str, Any]]) -> None:
+    """The database is switched to write-ahead logging."""
+    db = tmp_path / "test.db"
+    load_to_sqlite(sample_rows, db_path=db)
+
+    with sqlite3.connect(str(db)) as conn:
+        mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    assert mode == "wal"
+
+
+def test_load_to_sqlite_creates_city_timestamp_index(
+    tmp_path: Path, sample_rows: List[Dict[str, Any]]
+) -> None:
+    """Lookups by city and timestamp are served by an index."""
+    db = tmp_path / "test.db"
+    load_to_sqlite(sample_rows, db_path=db)
+
+    with sqlite3.connect(str(db)) as conn:
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM weather_current "
+            "WHERE city = ? AND timestamp >= ?",
+            ("Paris", "2026-02-18"),
+        ).fetchall()
+    assert any("ix_weather_city_ts" in row[-1] for row in plan)
+
+
+def test_load_to_sqlite_appends(tmp_path: Path, sample_rows: List[Dict[str, Any]]) -> None:
     """Subsequent loads append rather than overwrite."""
     db = tmp_path / "test.db"
-    load_to_sqlite(sample_df, db_path=db)
-    load_to_sqlite(sample_df, db_path=db)
+    load_to_sqlite(sample_rows, db_path=db)
+    load_to_sqlite(sample_rows, db_path=db)
 
     with sqlite3.connect(str(db)) as conn:
         rows = conn.execute("SELECT COUNT(*) FROM weather_current").fetchone()[0]
     assert rows == 4
 
 
-def test_load_to_sqlite_empty_df(tmp_path: Path) -> None:
-    """Empty DataFrame inserts nothing."""
+def test_load_to_sqlite_returns_batch_count(
+    tmp_path: Path, sample_rows: List[Dict[str, Any]]
+) -> None:
+    """The returned count covers only the current batch, not the table total."""
+    db = tmp_path / "test.db"
+    load_to_sqlite(sample_rows, db_path=db)
+
+    assert load_to_sqlite(sample_rows[:1], db_path=db) == 1
+
+
+def test_load_to_sqlite_empty_rows(tmp_path: Path) -> None:
+    """No rows inserts nothing."""
     db = tmp_path / "test.db"
-    result = load_to_sqlite(pd.DataFrame(), db_path=db)
+    result = load_to_sqlite([], db_path=db)
 
     assert result == 0
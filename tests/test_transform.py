@@ -5,7 +5,7 @@ from __future__ import annotations
 import pandas as pd
 import pytest
 
-from weather_etl.transform import EXPECTED_COLUMNS, transform
+from weather_etl.transform import EXPECTED_COLUMNS, as_dataframe, transform
 
 # ── Fixtures ─────────────────────────────────────────────────
 
@@ -33,43 +33,125 @@ RECORD_MISSING_CW = {
 
 
 def test_transform_single_valid_record() -> None:
-    """A single valid record produces a 1-row DataFrame."""
-    df = transform([VALID_RECORD])
+    """A single valid record produces a single row."""
+    rows = transform([VALID_RECORD])
 
-    assert isinstance(df, pd.DataFrame)
-    assert len(df) == 1
-    assert list(df.columns) == EXPECTED_COLUMNS
-    assert df.iloc[0]["city"] == "Paris"
-    assert df.iloc[0]["temperature_c"] == 7.2
+    assert isinstance(rows, list)
+    assert len(rows) == 1
+    assert list(rows[0]) == EXPECTED_COLUMNS
+    assert rows[0]["city"] == "Paris"
+    assert rows[0]["temperature_c"] == 7.2
 
 
 def test_transform_empty_list() -> None:
-    """An empty input produces an empty DataFrame with correct columns."""
-    df = transform([])
-
-    assert df.empty
-    assert list(df.columns) == EXPECTED_COLUMNS
+    """An empty input produces no rows."""
+    assert transform([]) == []
 
 
 def test_transform_skips_bad_records() -> None:
     """Records without 'current_weather' are skipped gracefully."""
-    df = transform([RECORD_MISSING_CW, VALID_RECORD])
+    rows = transform([RECORD_MISSING_CW, VALID_RECORD])
+
+    assert len(rows) == 1
+    assert rows[0]["city"] == "Paris"
 
-    assert len(df) == 1
-    assert df.iloc[0]["city"] == "Paris"
+
+def test_transform_skips_malformed_block() -> None:
+    """A non-mapping 'current_weather' block is skipped gracefully."""
+    malformed = {"city": "Broken", "raw": {"current_weather": ["unexpected"]}}
+    rows = transform([malformed, VALID_RECORD])
+
+    assert [row["city"] for row in rows] == ["Paris"]
 
 
 def test_transform_data_types() -> None:
-    """Numeric columns have proper data types after transformation."""
-    df = transform([VALID_RECORD])
+    """Numeric fields have proper types after transformation."""
+    row = transform([VALID_RECORD])[0]
+
+    assert isinstance(row["temperature_c"], float)
+    assert isinstance(row["windspeed_kmh"], float)
+    assert isinstance(row["winddirection_deg"], float)
+    assert isinstance(row["weathercode"], int)
+    assert isinstance(row["is_day"], int)
+
+
+def test_transform_non_numeric_coerced_to_none() -> None:
+    """Missing or non-numeric values become ``None`` instead of failing."""
+    record = {
+        "city": "Paris",
+        "raw": {"current_weather": {"time": "2026-02-18T22:00", "temperature": "n/a"}},
+    }
+    row = transform([record])[0]
 
+    assert row["temperature_c"] is None
+    assert row["weathercode"] is None
+
+
+def test_transform_integral_string_coerced_to_int() -> None:
+    """Integral values given as float strings still become ints."""
+    record = {
+        "city": "Paris",
+        "raw": {"current_weather": {"time": "2026-02-18T22:00", "weathercode": "3.0"}},
+    }
+    row = transform([record])[0]
+
+    assert row["weathercode"] == 3
+    assert isinstance(row["weathercode"], int)
+
+
+def test_transform_non_integral_code_coerced_to_none() -> None:
+    """Non-integral values for integer fields are rejected, not truncated."""
+    record = {
+        "city": "Paris",
+        "raw": {"current_weather": {"time": "2026-02-18T22:00", "weathercode": 2.9}},
+    }
+    row = transform([record])[0]
+
+    assert row["weathercode"] is None
+
+
+def test_transform_retrieval_timestamp_present() -> None:
+    """Every row has a non-null retrieval_timestamp."""
+    rows = transform([VALID_RECORD])
+
+    assert all(row["retrieval_timestamp"] for row in rows)
+
+
+def test_transform_retrieval_timestamp_shared() -> None:
+    """All rows of a batch share the same retrieval_timestamp."""
+    lyon = {**VALID_RECORD, "city": "Lyon"}
+    rows = transform([VALID_RECORD, lyon])
+
+    assert rows[0]["retrieval_timestamp"] == rows[1]["retrieval_timestamp"]
+
+
+# ── as_dataframe ─────────────────────────────────────────────
+
+
+def test_as_dataframe_data_types() -> None:
+    """Numeric columns have proper data types in the DataFrame."""
+    df = as_dataframe(transform([VALID_RECORD]))
+
+    assert list(df.columns) == EXPECTED_COLUMNS
     assert pd.api.types.is_float_dtype(df["temperature_c"])
     assert pd.api.types.is_float_dtype(df["windspeed_kmh"])
     assert pd.api.types.is_float_dtype(df["winddirection_deg"])
+    assert df["weathercode"].dtype == "Int64"
+    assert df["is_day"].dtype == "Int64"
 
 
-def test_transform_retrieval_timestamp_present() -> None:
-    """Every row has a non-null retrieval_timestamp."""
-    df = transform([VALID_RECORD])
+def test_as_dataframe_missing_values() -> None:
+    """``None`` fields become NaN / <NA> in the DataFrame."""
+    record = {"city": "Paris", "raw": {"current_weather": {"time": "2026-02-18T22:00"}}}
+    df = as_dataframe(transform([record]))
+
+    assert df["temperature_c"].isna().all()
+    assert df["weathercode"].isna().all()
 
-    assert df["retrieval_timestamp"].notna().all()
+
+def test_as_dataframe_empty() -> None:
+    """No rows produces an empty DataFrame with correct columns."""
+    df = as_dataframe([])
+
+    assert df.empty
+    assert list(df.columns) == EXPECTED_COLUMNS
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import logging
+import os
+from logging.handlers import MemoryHandler
 from pathlib import Path
 
 import pytest
@@ -26,6 +28,31 @@ def test_load_config_valid(tmp_path: Path) -> None:
     assert config["cities"][0]["name"] == "Test"
 
 
+def test_load_config_cached_copy(tmp_path: Path) -> None:
+    """Repeated loads return equal but independent dictionaries."""
+    cfg_file = tmp_path / "test.yaml"
+    cfg_file.write_text("cities:\n  - name: Test\n", encoding="utf-8")
+
+    first = load_config(cfg_file)
+    first["cities"].append({"name": "Mutated"})
+    second = load_config(cfg_file)
+
+    assert second == {"cities": [{"name": "Test"}]}
+
+
+def test_load_config_reloads_on_change(tmp_path: Path) -> None:
+    """Editing the file invalidates the cached result."""
+    cfg_file = tmp_path / "test.yaml"
+    cfg_file.write_text("cities:\n  - name: Old\n", encoding="utf-8")
+    load_config(cfg_file)
+
+    cfg_file.write_text("cities:\n  - name: New\n", encoding="utf-8")
+    mtime_ns = cfg_file.stat().st_mtime_ns + 1_000_000_000
+    os.utime(cfg_file, ns=(mtime_ns, mtime_ns))
+
+    assert load_config(cfg_file)["cities"][0]["name"] == "New"
+
+
 def test_load_config_missing_file() -> None:
     """A missing file raises FileNotFoundError."""
     with pytest.raises(FileNotFoundError):
@@ -47,6 +74,27 @@ def test_setup_logging_creates_log_dir(tmp_path: Path) -> None:
     logger.handlers.clear()
 
 
+def test_setup_logging_buffers_file_output(tmp_path: Path) -> None:
+    """File output is buffered until flushed and not propagated to root."""
+    logging.getLogger("weather_etl").handlers.clear()
+    logger = setup_logging(log_dir=tmp_path)
+    log_file = tmp_path / "weather_etl.log"
+
+    assert logger.propagate is False
+    assert any(isinstance(h, MemoryHandler) for h in logger.handlers)
+
+    logger.info("buffered message")
+    assert "buffered message" not in log_file.read_text(encoding="utf-8")
+
+    for handler in logger.handlers:
+        handler.flush()
+    assert "buffered message" in log_file.read_text(encoding="utf-8")
+
+    for handler in logger.handlers:
+        handler.close()
+    logger.handlers.clear()
+
+
 # ── ensure_directory ─────────────────────────────────────────
 
 
@@ -2,21 +2,80 @@
 Extract module – fetches current weather data from the Open-Meteo API.
 
 Implements:
-  • Per-city HTTP requests with configurable timeout.
-  • Exponential back-off retry logic for transient failures.
+  • Per-city HTTP requests with configurable timeout, dispatched concurrently
+    over a shared, connection-pooled ``requests.Session``.
+  • Exponential back-off retries for transient failures, handled by
+    ``urllib3.Retry`` on the session's transport adapter.
   • Graceful handling of partial failures (one bad city ≠ pipeline abort).
 """
 
 from __future__ import annotations
 
 import logging
-import time
+import random
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger("weather_etl.extract")
 
+# Upper bound on concurrent requests (and pooled connections per host)
+_MAX_WORKERS = 32
+
+# HTTP statuses worth retrying (transient server-side failures)
+_RETRY_STATUSES = (500, 502, 503, 504)
+
+# Ceiling for a single back-off wait, jitter included
+_MAX_BACKOFF_SECONDS = 30
+
+
+class _JitteredRetry(Retry):
+    """``Retry`` whose every back-off, including the first, is jittered.
+
+    urllib3's own schedule never waits before the first retry and only adds
+    jitter after it, so workers failing together would retry in lock-step.
+    """
+
+    def get_backoff_time(self) -> float:
+        attempt = len(self.history)
+        if attempt == 0:
+            return 0
+        wait = (self.backoff_factor ** attempt) * (0.5 + random.random())
+        return min(self.backoff_max, wait)
+
+
+@lru_cache(maxsize=None)
+def _get_session(max_retries: int, backoff_factor: float) -> requests.Session:
+    """Return a shared, connection-pooled session for the given retry policy.
+
+    Sessions are cached per policy so TCP/TLS connections are reused across
+    cities and pipeline runs.
+    """
+    retry = _JitteredRetry(
+        total=max_retries,
+        backoff_factor=backoff_factor,
+        backoff_max=_MAX_BACKOFF_SECONDS,
+        # A server-sent Retry-After would bypass the back-off cap
+        respect_retry_after_header=False,
+        status_forcelist=_RETRY_STATUSES,
+        allowed_methods=frozenset({"GET"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=_MAX_WORKERS,
+        pool_maxsize=_MAX_WORKERS,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
 
 def fetch_weather(
     city: Dict[str, Any],
@@ -25,6 +84,7 @@ def fetch_weather(
     max_retries: int = 3,
     backoff_factor: int = 2,
     current_weather: bool = True,
+    session: Optional[requests.Session] = None,
 ) -> Optional[Dict[str, Any]]:
     """Fetch current weather for a single city from the Open-Meteo API.
 
@@ -37,11 +97,17 @@ def fetch_weather(
     timeout : int
         HTTP request timeout in seconds.
     max_retries : int
-        How many times to retry on transient errors.
+        How many times to retry on timeouts, connection errors and
+        ``5xx`` responses.
     backoff_factor : int
-        Multiplier for exponential back-off between retries.
+        Multiplier for exponential back-off: after the *n*-th failed attempt
+        the wait is ``backoff_factor ** n`` seconds scaled by a random factor
+        in ``[0.5, 1.5)``, capped at 30 seconds.
     current_weather : bool
         Whether to request the ``current_weather`` block from the API.
+    session : requests.Session | None
+        Session to issue the request on; defaults to the shared session for
+        *max_retries* / *backoff_factor*.
 
     Returns
     -------
@@ -54,63 +120,27 @@ def fetch_weather(
         "current_weather": str(current_weather).lower(),
     }
 
-    for attempt in range(1, max_retries + 1):
-        try:
-            logger.info(
-                "Requesting weather for %s (attempt %d/%d)",
-                city["name"],
-                attempt,
-                max_retries,
-            )
-            response = requests.get(base_url, params=params, timeout=timeout)
-            response.raise_for_status()
-
-            data = response.json()
-            logger.info("Successfully fetched weather for %s", city["name"])
-            return data
-
-        except requests.exceptions.Timeout:
-            logger.warning(
-                "Timeout fetching %s (attempt %d/%d)",
-                city["name"],
-                attempt,
-                max_retries,
-            )
-        except requests.exceptions.HTTPError as exc:
-            logger.warning(
-                "HTTP error for %s: %s (attempt %d/%d)",
-                city["name"],
-                exc,
-                attempt,
-                max_retries,
-            )
-        except requests.exceptions.ConnectionError as exc:
-            logger.warning(
-                "Connection error for %s: %s (attempt %d/%d)",
-                city["name"],
-                exc,
-                attempt,
-                max_retries,
-            )
-        except requests.exceptions.RequestException as exc:
-            logger.error(
-                "Unrecoverable request error for %s: %s",
-                city["name"],
-                exc,
-            )
-            return None
-
-        if attempt < max_retries:
-            wait = backoff_factor ** attempt
-            logger.info("Retrying in %d seconds …", wait)
-            time.sleep(wait)
-
-    logger.error(
-        "All %d attempts failed for %s – skipping.",
-        max_retries,
-        city["name"],
-    )
-    return None
+    logger.debug("Requesting weather for %s", city["name"])
+    if session is None:
+        session = _get_session(max_retries, backoff_factor)
+    try:
+        response = session.get(base_url, params=params, timeout=timeout)
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+
+    except requests.exceptions.RequestException as exc:
+        logger.error(
+            "Request failed for %s after up to %d retries: %s – skipping.",
+            city["name"],
+            max_retries,
+            exc,
+        )
+        return None
+    except orjson.JSONDecodeError as exc:
+        logger.error("Invalid JSON response for %s: %s – skipping.", city["name"], exc)
+        return None
+
+    return data
 
 
 def extract_all(
@@ -119,6 +149,8 @@ def extract_all(
 ) -> List[Dict[str, Any]]:
     """Fetch weather data for every city in the list.
 
+    Requests are issued concurrently from a thread pool, so total latency is
+    bounded by the slowest city rather than the sum over all cities.
     Partial failures are logged but do **not** abort the pipeline; results
     for the remaining cities are still collected.
 
@@ -132,20 +164,45 @@ def extract_all(
     Returns
     -------
     list[dict]
-        A list of ``{"city": …, "raw": …}`` dicts for successful fetches.
+        A list of ``{"city": …, "raw": …}`` dicts for successful fetches,
+        in the same order as *cities*.
     """
-    results: List[Dict[str, Any]] = []
-    for city in cities:
-        raw = fetch_weather(
-            city=city,
-            base_url=api_config["base_url"],
-            timeout=api_config.get("timeout_seconds", 10),
-            max_retries=api_config.get("max_retries", 3),
-            backoff_factor=api_config.get("backoff_factor", 2),
-            current_weather=api_config.get("current_weather", True),
-        )
-        if raw is not None:
-            results.append({"city": city["name"], "raw": raw})
+    if not cities:
+        logger.info("Extraction complete: 0/0 cities succeeded.")
+        return []
+
+    # One slot per city, filled by index as requests complete
+    slots: List[Optional[Dict[str, Any]]] = [None] * len(cities)
+
+    max_retries = api_config.get("max_retries", 3)
+    backoff_factor = api_config.get("backoff_factor", 2)
+    # Resolved once here: lru_cache does not lock, so concurrent first calls
+    # from the workers could each build (and leak) their own session.
+    session = _get_session(max_retries, backoff_factor)
+
+    with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(cities))) as executor:
+        futures = {
+            executor.submit(
+                fetch_weather,
+                city=city,
+                base_url=api_config["base_url"],
+                timeout=api_config.get("timeout_seconds", 10),
+                max_retries=max_retries,
+                backoff_factor=backoff_factor,
+                current_weather=api_config.get("current_weather", True),
+                session=session,
+            ): i
+            for i, city in enumerate(cities)
+        }
+        for future in as_completed(futures):
+            raw = future.result()
+            if raw is not None:
+                i = futures[future]
+                name = cities[i]["name"]
+                logger.info("Fetched weather for %s", name)
+                slots[i] = {"city": name, "raw": raw}
+
+    results = [slot for slot in slots if slot is not None]
 
     logger.info(
         "Extraction complete: %d/%d cities succeeded.",
@@ -1,23 +1,29 @@
 """
-Load module – persists transformed data to CSV files and a SQLite database.
+Load module – persists transformed data to a rolling CSV file and a SQLite
+database.
 """
 
 from __future__ import annotations
 
+import csv
 import logging
 import sqlite3
-from datetime import datetime, timezone
+from contextlib import closing
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
-import pandas as pd
+from weather_etl.transform import EXPECTED_COLUMNS
 
 logger = logging.getLogger("weather_etl.load")
 
+# Rolling CSV file that every run appends to
+_CSV_FILENAME = "weather_data.csv"
+
 # SQL DDL for the persistent table
 _CREATE_TABLE_SQL = """
 CREATE TABLE IF NOT EXISTS weather_current (
-    id              INTEGER PRIMARY KEY AUTOINCREMENT,
+    id              INTEGER PRIMARY KEY,
     city            TEXT    NOT NULL,
     timestamp       TEXT,
     temperature_c   REAL,
@@ -29,52 +35,91 @@ CREATE TABLE IF NOT EXISTS weather_current (
 );
 """
 
+# Readers filter by city and time range
+_CREATE_INDEX_SQL = """
+CREATE INDEX IF NOT EXISTS ix_weather_city_ts
+    ON weather_current (city, timestamp);
+"""
+
+# Extracts a row's values in column order for csv.writer
+_ROW_VALUES = itemgetter(*EXPECTED_COLUMNS)
+
+_INSERT_SQL = (
+    f"INSERT INTO weather_current ({', '.join(EXPECTED_COLUMNS)}) "
+    f"VALUES ({', '.join(':' + col for col in EXPECTED_COLUMNS)})"
+)
+
+
+def _configure_conn(conn: sqlite3.Connection) -> None:
+    """Apply write-throughput pragmas to a freshly opened connection.
+
+    ``journal_mode=WAL`` is persistent and makes SQLite keep ``.db-wal`` /
+    ``.db-shm`` sidecar files next to the database while it is open; the
+    remaining pragmas are per-connection.
+    """
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-20000")  # ~20 MB page cache
+
 
 def load_to_csv(
-    df: pd.DataFrame,
+    rows: List[Dict[str, Any]],
     data_dir: str | Path = "data",
 ) -> Optional[Path]:
-    """Write the DataFrame to a timestamped CSV file.
+    """Append the transformed rows to the rolling CSV file in *data_dir*.
+
+    The header is written only when the file is created, so repeated runs
+    accumulate into a single file instead of one file per run.
 
     Parameters
     ----------
-    df : pd.DataFrame
-        Transformed weather data.
+    rows : list[dict]
+        Transformed weather data, as returned by
+        :func:`weather_etl.transform.transform`.
     data_dir : str | Path
-        Directory where CSV files are stored.
+        Directory where the CSV file is stored.
 
     Returns
     -------
     Path or None
-        Path to the written CSV file, or ``None`` if the DataFrame is empty.
+        Path to the CSV file, or ``None`` if there are no rows.
     """
-    if df.empty:
-        logger.warning("Empty DataFrame – CSV not written.")
+    if not rows:
+        logger.warning("No rows – CSV not written.")
         return None
 
     data_dir = Path(data_dir)
     data_dir.mkdir(parents=True, exist_ok=True)
 
-    ts = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-    filepath = data_dir / f"weather_data_{ts}.csv"
+    filepath = data_dir / _CSV_FILENAME
+    write_header = not filepath.exists() or filepath.stat().st_size == 0
+
+    with open(filepath, "a", newline="", encoding="utf-8", buffering=1 << 20) as fh:
+        writer = csv.writer(fh)
+        if write_header:
+            writer.writerow(EXPECTED_COLUMNS)
+        writer.writerows(map(_ROW_VALUES, rows))
 
-    df.to_csv(filepath, index=False, encoding="utf-8")
-    logger.info("CSV saved: %s (%d rows)", filepath, len(df))
+    logger.info("CSV appended: %s (%d rows)", filepath, len(rows))
     return filepath
 
 
 def load_to_sqlite(
-    df: pd.DataFrame,
+    rows: List[Dict[str, Any]],
     db_path: str | Path = "data/weather.db",
 ) -> int:
-    """Append the DataFrame to the ``weather_current`` table in SQLite.
+    """Append the transformed rows to the ``weather_current`` table in SQLite.
 
-    The table is created automatically if it does not exist.
+    The table and its ``(city, timestamp)`` index are created automatically
+    if they do not exist.  Rows are bound with a single ``executemany``
+    inside one transaction.
 
     Parameters
     ----------
-    df : pd.DataFrame
-        Transformed weather data.
+    rows : list[dict]
+        Transformed weather data, as returned by
+        :func:`weather_etl.transform.transform`.
     db_path : str | Path
         Path to the SQLite database file.
 
@@ -83,32 +128,21 @@ def load_to_sqlite(
     int
         Number of rows inserted.
     """
-    if df.empty:
-        logger.warning("Empty DataFrame – nothing to insert into SQLite.")
+    if not rows:
+        logger.warning("No rows – nothing to insert into SQLite.")
         return 0
 
     db_path = Path(db_path)
     db_path.parent.mkdir(parents=True, exist_ok=True)
 
     try:
-        with sqlite3.connect(str(db_path)) as conn:
+        with closing(sqlite3.connect(str(db_path))) as conn, conn:
+            _configure_conn(conn)
             conn.execute(_CREATE_TABLE_SQL)
-            rows_before = conn.execute(
-                "SELECT COUNT(*) FROM weather_current"
-            ).fetchone()[0]
-
-            df.to_sql("weather_current", conn, if_exists="append", index=False)
-
-            rows_after = conn.execute(
-                "SELECT COUNT(*) FROM weather_current"
-            ).fetchone()[0]
-            inserted = rows_after - rows_before
-
-        logger.info(
-            "SQLite: inserted %d rows into weather_current (total: %d)",
-            inserted,
-            rows_after,
-        )
+            conn.execute(_CREATE_INDEX_SQL)
+            inserted = conn.executemany(_INSERT_SQL, rows).rowcount
+
+        logger.info("SQLite: inserted %d rows into weather_current", inserted)
         return inserted
 
     except sqlite3.Error as exc:
@@ -1,5 +1,9 @@
 """
-Transform module – converts raw API responses into a clean pandas DataFrame.
+Transform module – converts raw API responses into clean, typed row dicts.
+
+The pipeline handles a handful of cities per run, so rows are kept as plain
+dictionaries end to end; :func:`as_dataframe` materialises a pandas DataFrame
+only for consumers that need one.
 
 Output columns:
   city, timestamp, temperature_c, windspeed_kmh, winddirection_deg,
@@ -10,13 +14,15 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, timezone
+from operator import itemgetter
 from typing import Any, Dict, List, Optional
 
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger("weather_etl.transform")
 
-# Columns expected in the final DataFrame
+# Columns expected in every output row
 EXPECTED_COLUMNS: List[str] = [
     "city",
     "timestamp",
@@ -28,19 +34,51 @@ EXPECTED_COLUMNS: List[str] = [
     "retrieval_timestamp",
 ]
 
+# Keys read from the API's ``current_weather`` block, in unpacking order
+_CURRENT_WEATHER_KEYS = (
+    "time",
+    "temperature",
+    "windspeed",
+    "winddirection",
+    "weathercode",
+    "is_day",
+)
+_get_current_weather = itemgetter(*_CURRENT_WEATHER_KEYS)
+
+
+def _as_float(value: Any) -> Optional[float]:
+    """Coerce *value* to ``float``, returning ``None`` if it is not numeric."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _as_int(value: Any) -> Optional[int]:
+    """Coerce *value* to ``int``, returning ``None`` if it is not integral."""
+    number = _as_float(value)
+    if number is None or not number.is_integer():
+        return None
+    return int(number)
+
 
-def _parse_single(record: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+def _parse_single(
+    record: Dict[str, Any],
+    retrieval_timestamp: str,
+) -> Optional[Dict[str, Any]]:
     """Parse a single city's raw API response into a flat dictionary.
 
     Parameters
     ----------
     record : dict
         Must contain ``city`` (str) and ``raw`` (dict with ``current_weather``).
+    retrieval_timestamp : str
+        ISO-8601 UTC timestamp shared by every row of the batch.
 
     Returns
     -------
     dict or None
-        Flat dict ready for DataFrame construction, or ``None`` on failure.
+        Flat, typed dict keyed by ``EXPECTED_COLUMNS``, or ``None`` on failure.
     """
     city_name = record.get("city", "unknown")
     raw = record.get("raw", {})
@@ -51,15 +89,22 @@ def _parse_single(record: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         return None
 
     try:
+        try:
+            values = _get_current_weather(current)
+        except KeyError:
+            # Slow path: tolerate missing fields as ``None``
+            values = tuple(current.get(key) for key in _CURRENT_WEATHER_KEYS)
+        timestamp, temperature, windspeed, winddirection, weathercode, is_day = values
+
         parsed: Dict[str, Any] = {
             "city": city_name,
-            "timestamp": current.get("time"),
-            "temperature_c": current.get("temperature"),
-            "windspeed_kmh": current.get("windspeed"),
-            "winddirection_deg": current.get("winddirection"),
-            "weathercode": current.get("weathercode"),
-            "is_day": current.get("is_day"),
-            "retrieval_timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": timestamp,
+            "temperature_c": _as_float(temperature),
+            "windspeed_kmh": _as_float(windspeed),
+            "winddirection_deg": _as_float(winddirection),
+            "weathercode": _as_int(weathercode),
+            "is_day": _as_int(is_day),
+            "retrieval_timestamp": retrieval_timestamp,
         }
         return parsed
 
@@ -68,8 +113,8 @@ def _parse_single(record: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         return None
 
 
-def transform(raw_records: List[Dict[str, Any]]) -> pd.DataFrame:
-    """Transform a list of raw extraction records into a structured DataFrame.
+def transform(raw_records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Transform a list of raw extraction records into structured rows.
 
     Parameters
     ----------
@@ -79,28 +124,49 @@ def transform(raw_records: List[Dict[str, Any]]) -> pd.DataFrame:
 
     Returns
     -------
-    pd.DataFrame
-        Structured DataFrame with columns defined in ``EXPECTED_COLUMNS``.
+    list[dict]
+        One dict per city with the keys defined in ``EXPECTED_COLUMNS``.
         May be empty if every record failed to parse.
     """
+    retrieval_timestamp = datetime.now(timezone.utc).isoformat()
+
     rows: List[Dict[str, Any]] = []
     for record in raw_records:
-        parsed = _parse_single(record)
+        parsed = _parse_single(record, retrieval_timestamp)
         if parsed is not None:
             rows.append(parsed)
 
     if not rows:
-        logger.warning("Transform produced an empty DataFrame.")
-        return pd.DataFrame(columns=EXPECTED_COLUMNS)
+        logger.warning("Transform produced no rows.")
+        return rows
+
+    logger.info("Transform complete: %d rows produced.", len(rows))
+    return rows
+
+
+def as_dataframe(rows: List[Dict[str, Any]]) -> pd.DataFrame:
+    """Build a typed pandas DataFrame from the rows returned by :func:`transform`.
+
+    Parameters
+    ----------
+    rows : list[dict]
+        Output of :func:`transform`.
 
-    df = pd.DataFrame(rows, columns=EXPECTED_COLUMNS)
+    Returns
+    -------
+    pd.DataFrame
+        DataFrame with columns defined in ``EXPECTED_COLUMNS``; numeric
+        columns are ``float64`` and ``weathercode``/``is_day`` are ``Int64``.
+    """
+    if not rows:
+        return pd.DataFrame(columns=EXPECTED_COLUMNS)
 
-    # Ensure proper data types
-    df["temperature_c"] = pd.to_numeric(df["temperature_c"], errors="coerce")
-    df["windspeed_kmh"] = pd.to_numeric(df["windspeed_kmh"], errors="coerce")
-    df["winddirection_deg"] = pd.to_numeric(df["winddirection_deg"], errors="coerce")
-    df["weathercode"] = pd.to_numeric(df["weathercode"], errors="coerce").astype("Int64")
-    df["is_day"] = pd.to_numeric(df["is_day"], errors="coerce").astype("Int64")
+    # Rows are already coerced by _parse_single, so each column is built once
+    # with its final dtype (``None`` becomes NaN / <NA>).
+    columns = {col: [row[col] for row in rows] for col in EXPECTED_COLUMNS}
+    for col in ("temperature_c", "windspeed_kmh", "winddirection_deg"):
+        columns[col] = np.asarray(columns[col], dtype=np.float64)
+    for col in ("weathercode", "is_day"):
+        columns[col] = pd.array(columns[col], dtype="Int64")
 
-    logger.info("Transform complete: %d rows produced.", len(df))
-    return df
+    return pd.DataFrame(columns, columns=EXPECTED_COLUMNS)
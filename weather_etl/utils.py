@@ -4,19 +4,33 @@ Utility helpers – configuration loading, logging setup, and shared constants.
 
 from __future__ import annotations
 
+import copy
 import logging
 import os
 import sys
-from logging.handlers import RotatingFileHandler
+from functools import lru_cache
+from logging.handlers import MemoryHandler, RotatingFileHandler
 from pathlib import Path
 from typing import Any, Dict
 
 import yaml
 
+try:  # libyaml C bindings are much faster when PyYAML was built with them
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 # ── Configuration ────────────────────────────────────────────
 
 
+@lru_cache(maxsize=8)
+def _load_yaml(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a YAML file, cached on its path and modification time."""
+    with open(path, "r", encoding="utf-8") as fh:
+        return yaml.load(fh, Loader=_YamlLoader)
+
+
 def load_config(config_path: str | Path | None = None) -> Dict[str, Any]:
     """Load the YAML configuration file and return it as a dictionary.
 
@@ -25,6 +39,9 @@ def load_config(config_path: str | Path | None = None) -> Dict[str, Any]:
       2. ``WEATHER_ETL_CONFIG`` environment variable.
       3. ``config/cities.yaml`` relative to the project root.
 
+    Parsed files are cached until their modification time changes; each call
+    returns an independent copy.
+
     Parameters
     ----------
     config_path : str | Path | None
@@ -52,10 +69,9 @@ def load_config(config_path: str | Path | None = None) -> Dict[str, Any]:
     if not config_path.exists():
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
-    with open(config_path, "r", encoding="utf-8") as fh:
-        config: Dict[str, Any] = yaml.safe_load(fh)
-
-    return config
+    config_path = config_path.resolve()
+    config = _load_yaml(str(config_path), config_path.stat().st_mtime_ns)
+    return copy.deepcopy(config)
 
 
 # ── Logging ──────────────────────────────────────────────────
@@ -66,11 +82,14 @@ def setup_logging(
     log_level: int = logging.INFO,
     max_bytes: int = 5 * 1024 * 1024,
     backup_count: int = 5,
+    buffer_capacity: int = 256,
 ) -> logging.Logger:
     """Configure and return the application-wide logger.
 
     Creates a rotating file handler **and** a stream (console) handler so that
     every message is visible both in the terminal and persisted on disk.
+    File writes are buffered in memory and flushed when the buffer fills, on
+    any ``WARNING`` or higher record, or when the handlers are flushed.
 
     Parameters
     ----------
@@ -82,6 +101,8 @@ def setup_logging(
         Maximum size of a single log file before rotation (default 5 MB).
     backup_count : int
         Number of rotated log files to keep.
+    buffer_capacity : int
+        Number of records buffered before they are written to the log file.
 
     Returns
     -------
@@ -93,6 +114,7 @@ def setup_logging(
 
     logger = logging.getLogger("weather_etl")
     logger.setLevel(log_level)
+    logger.propagate = False
 
     # Avoid duplicate handlers when the function is called multiple times
     if logger.handlers:
@@ -112,13 +134,19 @@ def setup_logging(
     )
     file_handler.setLevel(log_level)
     file_handler.setFormatter(formatter)
+    buffered_file_handler = MemoryHandler(
+        capacity=buffer_capacity,
+        flushLevel=logging.WARNING,
+        target=file_handler,
+    )
+    buffered_file_handler.setLevel(log_level)
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(log_level)
     console_handler.setFormatter(formatter)
 
-    logger.addHandler(file_handler)
+    logger.addHandler(buffered_file_handler)
     logger.addHandler(console_handler)
 
     return logger